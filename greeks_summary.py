@@ -7,220 +7,354 @@ that complement the comprehensive notebook.
 """
 
 import math
+from functools import lru_cache
 
-# Import our validated Greeks functions
-from greeks_validation import (
-    black_scholes_price, delta_analytical, gamma_analytical, 
-    theta_analytical, vega_analytical, rho_analytical,
-    GreeksCalculator
-)
+# numpy and greeks_vec (which pulls in scipy) are imported lazily by
+# _lazy_imports() so importing this module for its helpers stays cheap.
+np = all_greeks_vec = None
 
-def practical_hedging_example():
-    """Demonstrate practical delta hedging scenario"""
-    print("=" * 60)
-    print("PRACTICAL DELTA HEDGING EXAMPLE")
-    print("=" * 60)
-    print()
+def _lazy_imports():
+    """Import the numerical stack on first use"""
+    global np, all_greeks_vec
+    if all_greeks_vec is None:
+        import numpy as np
+        # Import our validated Greeks functions
+        from greeks_vec import all_greeks_vec
+
+# Inputs for every analysis table. All rows are priced together by a
+# single all_greeks_vec call in _scenario_results().
+_HEDGE_PARAMS = (100, 105, 0.25, 0.05, 0.25)  # S, K, T, r, sigma: 3-month OTM call
+_HEDGE_MOVES = [-3, -2, -1, 0, 1, 2, 3]
+_DECAY_PARAMS = (100, 100, 0.05, 0.2)  # S, K, r, sigma: ATM option
+_DECAY_DAYS = [90, 60, 30, 21, 14, 7, 3, 1]
+_VOL_PARAMS = (100, 100, 1.0, 0.05)  # S, K, T, r: 1-year ATM option
+_VOL_BASE_SIGMA = 0.20
+_VOL_CHANGES = [-0.10, -0.05, -0.02, 0, +0.02, +0.05, +0.10]
+_MONEYNESS_PARAMS = (100, 0.25, 0.05, 0.2)  # S, T, r, sigma: 3-month options
+_MONEYNESS_STRIKES = [85, 90, 95, 100, 105, 110, 115]
+
+_SCENARIO_FIELDS = ('S', 'K', 'T', 'r', 'sigma', 'flag')
+
+# Table headers and row templates, built once at import time
+_HEDGE_HEADER = f"{'Stock Move':<12} {'New Price':<12} {'Option P&L':<12} {'Stock P&L':<12} {'Total P&L':<12}"
+_HEDGE_ROW_FMT = "{move:+8.0f}     ${new_S:8.2f}     ${option_pnl:+8.0f}     ${stock_pnl:+8.0f}     ${total_pnl:+8.0f}"
+_DECAY_HEADER = f"{'Days to Exp':<12} {'Option Price':<14} {'Theta/Day':<12} {'% of Price':<12}"
+_DECAY_ROW_FMT = "{days:8.0f}     ${price:8.4f}     ${theta_daily:8.4f}     {theta_percent:8.2f}%"
+_VOL_HEADER = f"{'Vol Change':<12} {'New Vol':<10} {'Call Price':<12} {'Put Price':<12} {'Price Change':<12}"
+_VOL_ROW_FMT = "{vol_change:+8.0%}     {new_sigma:6.0%}     ${new_call:8.4f}     ${new_put:8.4f}     ${call_change:+8.4f}"
+_MONEYNESS_HEADER = f"{'Strike':<8} {'Moneyness':<12} {'Delta':<8} {'Gamma':<10} {'Theta':<10} {'Vega':<8}"
+_MONEYNESS_ROW_FMT = "{K:<8} {moneyness:<12} {delta:<8.3f} {gamma:<10.5f} {theta:<10.4f} {vega:<8.3f}"
+
+def _build_scenarios():
+    """List every (tag, S, K, T, r, sigma, flag) row used by the analyses"""
+    scenarios = []
+
+    def add(tag, S, K, T, r, sigma, flag='call'):
+        scenarios.append({'tag': tag, 'S': S, 'K': K, 'T': T, 'r': r,
+                          'sigma': sigma, 'flag': flag})
+
+    S, K, T, r, sigma = _HEDGE_PARAMS
+    add('hedge_base', S, K, T, r, sigma)
+
+    S, K, r, sigma = _DECAY_PARAMS
+    for days in _DECAY_DAYS:
+        add('decay', S, K, days / 365, r, sigma)
+
+    S, K, T, r = _VOL_PARAMS
+    for flag in ('call', 'put'):
+        add(f'vol_base_{flag}', S, K, T, r, _VOL_BASE_SIGMA, flag)
+
+    S, T, r, sigma = _MONEYNESS_PARAMS
+    for K in _MONEYNESS_STRIKES:
+        add('moneyness', S, K, T, r, sigma)
+
+    return scenarios
+
+_SCENARIOS = _build_scenarios()
+
+@lru_cache(maxsize=None)
+def _scenario_results(precision='fast'):
+    """
+    Price all scenarios in one vectorized call and group the rows by tag
+
+    precision is passed to all_greeks_vec ('fast' or 'exact'); each
+    precision is priced and cached separately.
+    """
+    _lazy_imports()
+    columns = {field: np.array([row[field] for row in _SCENARIOS])
+               for field in _SCENARIO_FIELDS}
+    columns.update(all_greeks_vec(columns['S'], columns['K'], columns['T'],
+                                  columns['r'], columns['sigma'], columns['flag'],
+                                  precision=precision))
+    tags = np.array([row['tag'] for row in _SCENARIOS])
+    return {tag: {name: values[tags == tag] for name, values in columns.items()}
+            for tag in dict.fromkeys(row['tag'] for row in _SCENARIOS)}
+
+def practical_hedging_example(exact=False):
+    """
+    Demonstrate practical delta hedging scenario
+
+    By default the scenario prices use the second-order expansion
+    price + delta * dS + 0.5 * gamma * dS^2 from the base-case Greeks;
+    exact=True reprices every stock move with Black-Scholes instead.
+    """
+    _lazy_imports()
+    lines = []
+    lines.append("=" * 60)
+    lines.append("PRACTICAL DELTA HEDGING EXAMPLE")
+    lines.append("=" * 60)
+    lines.append("")
     
     # Portfolio: Long 10 call contracts (1000 shares equivalent)
-    S, K, T, r, sigma = 100, 105, 0.25, 0.05, 0.25  # 3-month OTM call
+    S, K, T, r, sigma = _HEDGE_PARAMS  # 3-month OTM call
     contracts = 10
     shares_per_contract = 100
     total_shares_equivalent = contracts * shares_per_contract
     
-    calc = GreeksCalculator(S, K, T, r, sigma)
-    call_price = calc.all_greeks('call')['price']
-    call_delta = calc.all_greeks('call')['delta']
+    results = _scenario_results('exact' if exact else 'fast')
+    call_price = results['hedge_base']['price'][0]
+    call_delta = results['hedge_base']['delta'][0]
+    call_gamma = results['hedge_base']['gamma'][0]
     
-    hedge_shares = int(call_delta * total_shares_equivalent)
+    # Round to the nearest share; int() alone truncates toward zero, which
+    # under-hedges both calls and puts
+    hedge_shares = int(round(call_delta * total_shares_equivalent))
+    assert 0 <= hedge_shares <= total_shares_equivalent  # long calls: 0 <= delta <= 1
     
-    print(f"Portfolio: Long {contracts} call contracts (Strike ${K}, {T*12:.0f} months)")
-    print(f"Current stock price: ${S}")
-    print(f"Call option price: ${call_price:.4f}")
-    print(f"Call delta: {call_delta:.4f}")
-    print(f"")
-    print(f"Delta hedge: Sell {hedge_shares} shares of underlying stock")
-    print(f"Hedge ratio: {call_delta:.1%} (for every option, sell {call_delta:.2f} shares)")
-    print()
+    lines.append(f"Portfolio: Long {contracts} call contracts (Strike ${K}, {T*12:.0f} months)")
+    lines.append(f"Current stock price: ${S}")
+    lines.append(f"Call option price: ${call_price:.4f}")
+    lines.append(f"Call delta: {call_delta:.4f}")
+    lines.append(f"")
+    lines.append(f"Delta hedge: Sell {hedge_shares} shares of underlying stock")
+    lines.append(f"Hedge ratio: {call_delta:.1%} (for every option, sell {call_delta:.2f} shares)")
+    lines.append("")
     
     # Scenario analysis
-    print("SCENARIO ANALYSIS: Stock price movements")
-    print("-" * 50)
-    print(f"{'Stock Move':<12} {'New Price':<12} {'Option P&L':<12} {'Stock P&L':<12} {'Total P&L':<12}")
-    print("-" * 60)
-    
-    for move in [-3, -2, -1, 0, 1, 2, 3]:
-        new_S = S + move
-        calc_new = GreeksCalculator(new_S, K, T, r, sigma)
-        new_call_price = calc_new.all_greeks('call')['price']
-        
-        option_pnl = (new_call_price - call_price) * total_shares_equivalent
-        stock_pnl = -move * hedge_shares  # Negative because we're short stock
-        total_pnl = option_pnl + stock_pnl
-        
-        print(f"{move:+8.0f}     ${new_S:8.2f}     ${option_pnl:+8.0f}     ${stock_pnl:+8.0f}     ${total_pnl:+8.0f}")
+    lines.append("SCENARIO ANALYSIS: Stock price movements")
+    lines.append("-" * 50)
+    lines.append(_HEDGE_HEADER)
+    lines.append("-" * 60)
     
-    print()
-    print("Note: Small total P&L shows effective hedging. Larger moves show gamma risk.")
-    print()
+    moves = np.array(_HEDGE_MOVES)
+    new_S_arr = S + moves
+    if exact:
+        new_call_prices = all_greeks_vec(new_S_arr, K, T, r, sigma, 'call',
+                                         precision='exact')['price']
+    else:
+        new_call_prices = call_price + call_delta * moves + 0.5 * call_gamma * moves**2
+    
+    option_pnl = (new_call_prices - call_price) * total_shares_equivalent
+    stock_pnl = -moves * hedge_shares  # Negative because we're short stock
+    total_pnl = option_pnl + stock_pnl
+    
+    for move, new_S, move_option_pnl, move_stock_pnl, move_total_pnl in zip(
+            moves, new_S_arr, option_pnl, stock_pnl, total_pnl):
+        lines.append(_HEDGE_ROW_FMT.format(move=move, new_S=new_S, option_pnl=move_option_pnl,
+                                           stock_pnl=move_stock_pnl, total_pnl=move_total_pnl))
+    
+    lines.append("")
+    lines.append("Note: Small total P&L shows effective hedging. Larger moves show gamma risk.")
+    if not exact:
+        lines.append("Option prices use the delta-gamma expansion; run with --exact to reprice.")
+    lines.append("")
+    
+    report = "\n".join(lines)
+    print(report)
+    return report
 
-def time_decay_analysis():
-    """Analyze time decay (Theta) behavior"""
-    print("=" * 60)
-    print("TIME DECAY (THETA) ANALYSIS")
-    print("=" * 60)
-    print()
+def time_decay_analysis(exact=False):
+    """
+    Analyze time decay (Theta) behavior
+
+    exact=True prices the table with the exact normal CDF instead of the
+    fast approximation.
+    """
+    _lazy_imports()
+    lines = []
+    lines.append("=" * 60)
+    lines.append("TIME DECAY (THETA) ANALYSIS")
+    lines.append("=" * 60)
+    lines.append("")
     
-    S, K, r, sigma = 100, 100, 0.05, 0.2  # ATM option
+    lines.append("Theta acceleration as expiration approaches (ATM Call):")
+    lines.append(_DECAY_HEADER)
+    lines.append("-" * 52)
     
-    print("Theta acceleration as expiration approaches (ATM Call):")
-    print(f"{'Days to Exp':<12} {'Option Price':<14} {'Theta/Day':<12} {'% of Price':<12}")
-    print("-" * 52)
+    greeks = _scenario_results('exact' if exact else 'fast')['decay']
+    theta_percent_arr = (np.abs(greeks['theta']) / greeks['price']) * 100
     
-    for days in [90, 60, 30, 21, 14, 7, 3, 1]:
-        T = days / 365
-        calc = GreeksCalculator(S, K, T, r, sigma)
-        greeks = calc.all_greeks('call')
-        price = greeks['price']
-        theta_daily = greeks['theta']
-        theta_percent = (abs(theta_daily) / price) * 100
-        
-        print(f"{days:8.0f}     ${price:8.4f}     ${theta_daily:8.4f}     {theta_percent:8.2f}%")
+    for days, price, theta_daily, theta_percent in zip(
+            _DECAY_DAYS, greeks['price'], greeks['theta'], theta_percent_arr):
+        lines.append(_DECAY_ROW_FMT.format(days=days, price=price, theta_daily=theta_daily,
+                                           theta_percent=theta_percent))
     
-    print()
-    print("Key Insights:")
-    print("- Theta accelerates dramatically in final weeks")
-    print("- Daily decay becomes significant portion of option value")
-    print("- Time decay is highest for at-the-money options")
-    print()
+    lines.append("")
+    lines.append("Key Insights:")
+    lines.append("- Theta accelerates dramatically in final weeks")
+    lines.append("- Daily decay becomes significant portion of option value")
+    lines.append("- Time decay is highest for at-the-money options")
+    lines.append("")
+    
+    report = "\n".join(lines)
+    print(report)
+    return report
 
-def volatility_impact_analysis():
-    """Analyze volatility (Vega) impact"""
-    print("=" * 60)
-    print("VOLATILITY (VEGA) IMPACT ANALYSIS")
-    print("=" * 60)
-    print()
+def volatility_impact_analysis(exact=False):
+    """
+    Analyze volatility (Vega) impact
+
+    By default the table uses the first-order approximation
+    price(sigma + dv) ~ price(sigma) + vega * dv from the base-case vega;
+    exact=True reprices every row with Black-Scholes instead.
+    """
+    _lazy_imports()
+    lines = []
+    lines.append("=" * 60)
+    lines.append("VOLATILITY (VEGA) IMPACT ANALYSIS")
+    lines.append("=" * 60)
+    lines.append("")
     
-    S, K, T, r = 100, 100, 1.0, 0.05  # 1-year ATM option
-    
-    print("Impact of volatility changes on option value:")
-    print(f"{'Vol Change':<12} {'New Vol':<10} {'Call Price':<12} {'Put Price':<12} {'Price Change':<12}")
-    print("-" * 60)
-    
-    base_sigma = 0.20
-    calc_base = GreeksCalculator(S, K, T, r, base_sigma)
-    base_call = calc_base.all_greeks('call')['price']
-    base_put = calc_base.all_greeks('put')['price']
-    
-    for vol_change in [-0.10, -0.05, -0.02, 0, +0.02, +0.05, +0.10]:
-        new_sigma = base_sigma + vol_change
-        if new_sigma <= 0:
-            continue
-            
-        calc_new = GreeksCalculator(S, K, T, r, new_sigma)
-        new_call = calc_new.all_greeks('call')['price']
-        new_put = calc_new.all_greeks('put')['price']
-        
-        call_change = new_call - base_call
-        put_change = new_put - base_put
-        
-        print(f"{vol_change:+8.0%}     {new_sigma:6.0%}     ${new_call:8.4f}     ${new_put:8.4f}     ${call_change:+8.4f}")
-    
-    vega = calc_base.all_greeks('call')['vega']
-    print(f"\nVega (per 1% vol change): ${vega:.4f}")
-    print("Note: Vega is same for calls and puts")
-    print()
+    lines.append("Impact of volatility changes on option value:")
+    lines.append(_VOL_HEADER)
+    lines.append("-" * 60)
+    
+    results = _scenario_results('exact' if exact else 'fast')
+    base_call = results['vol_base_call']['price'][0]
+    base_put = results['vol_base_put']['price'][0]
+    vega = results['vol_base_call']['vega'][0]
+    
+    vol_changes = np.array([dv for dv in _VOL_CHANGES if _VOL_BASE_SIGMA + dv > 0])
+    new_sigmas = _VOL_BASE_SIGMA + vol_changes
+    if exact:
+        S, K, T, r = _VOL_PARAMS
+        # Row 0 holds the calls, row 1 the puts
+        flags = np.array([['call'], ['put']])
+        new_calls, new_puts = all_greeks_vec(S, K, T, r, new_sigmas, flags,
+                                             precision='exact')['price']
+    else:
+        # vega is quoted per 1% vol, vol_changes are absolute (0.01 = 1%)
+        new_calls = base_call + vega * 100 * vol_changes
+        new_puts = base_put + vega * 100 * vol_changes
+    
+    for vol_change, new_sigma, new_call, new_put in zip(vol_changes, new_sigmas, new_calls, new_puts):
+        lines.append(_VOL_ROW_FMT.format(vol_change=vol_change, new_sigma=new_sigma, new_call=new_call,
+                                         new_put=new_put, call_change=new_call - base_call))
+    
+    lines.append(f"\nVega (per 1% vol change): ${vega:.4f}")
+    lines.append("Note: Vega is same for calls and puts")
+    if not exact:
+        lines.append("Prices use the linear vega approximation; run with --exact to reprice.")
+    lines.append("")
+    
+    report = "\n".join(lines)
+    print(report)
+    return report
 
-def moneyness_analysis():
-    """Analyze Greeks across different moneyness levels"""
-    print("=" * 60)
-    print("GREEKS vs MONEYNESS ANALYSIS")
-    print("=" * 60)
-    print()
+def moneyness_analysis(exact=False):
+    """
+    Analyze Greeks across different moneyness levels
+
+    exact=True prices the table with the exact normal CDF instead of the
+    fast approximation.
+    """
+    _lazy_imports()
+    lines = []
+    lines.append("=" * 60)
+    lines.append("GREEKS vs MONEYNESS ANALYSIS")
+    lines.append("=" * 60)
+    lines.append("")
     
-    S, T, r, sigma = 100, 0.25, 0.05, 0.2  # 3-month options
-    
-    print("Call Option Greeks at different strike prices:")
-    print(f"{'Strike':<8} {'Moneyness':<12} {'Delta':<8} {'Gamma':<10} {'Theta':<10} {'Vega':<8}")
-    print("-" * 60)
-    
-    for K in [85, 90, 95, 100, 105, 110, 115]:
-        calc = GreeksCalculator(S, K, T, r, sigma)
-        greeks = calc.all_greeks('call')
-        
-        if K < S:
-            moneyness = "ITM"
-        elif K == S:
-            moneyness = "ATM"
-        else:
-            moneyness = "OTM"
-        
-        print(f"{K:<8} {moneyness:<12} {greeks['delta']:<8.3f} {greeks['gamma']:<10.5f} {greeks['theta']:<10.4f} {greeks['vega']:<8.3f}")
+    S = _MONEYNESS_PARAMS[0]
     
-    print()
-    print("Key Observations:")
-    print("- Delta increases with moneyness (ITM > ATM > OTM)")
-    print("- Gamma is highest for ATM options")
-    print("- Vega is highest for ATM options")
-    print("- Theta (time decay) is most negative for ATM options")
-    print()
+    lines.append("Call Option Greeks at different strike prices:")
+    lines.append(_MONEYNESS_HEADER)
+    lines.append("-" * 60)
+    
+    greeks_arr = _scenario_results('exact' if exact else 'fast')['moneyness']
+    
+    strikes = np.array(_MONEYNESS_STRIKES)
+    moneyness = np.select([strikes < S, strikes == S], ["ITM", "ATM"], default="OTM")
+    
+    for K, label, delta, gamma, theta, vega in zip(
+            strikes, moneyness, greeks_arr['delta'], greeks_arr['gamma'],
+            greeks_arr['theta'], greeks_arr['vega']):
+        lines.append(_MONEYNESS_ROW_FMT.format(K=K, moneyness=label, delta=delta,
+                                               gamma=gamma, theta=theta, vega=vega))
+    
+    lines.append("")
+    lines.append("Key Observations:")
+    lines.append("- Delta increases with moneyness (ITM > ATM > OTM)")
+    lines.append("- Gamma is highest for ATM options")
+    lines.append("- Vega is highest for ATM options")
+    lines.append("- Theta (time decay) is most negative for ATM options")
+    lines.append("")
+    
+    report = "\n".join(lines)
+    print(report)
+    return report
 
 def risk_management_insights():
     """Provide risk management insights using Greeks"""
-    print("=" * 60)
-    print("RISK MANAGEMENT INSIGHTS")
-    print("=" * 60)
-    print()
+    lines = []
+    lines.append("=" * 60)
+    lines.append("RISK MANAGEMENT INSIGHTS")
+    lines.append("=" * 60)
+    lines.append("")
     
-    print("1. DELTA RISK (Directional Risk)")
-    print("-" * 35)
-    print("• Delta measures directional exposure to underlying price")
-    print("• Portfolio delta = sum of individual position deltas")
-    print("• Delta-neutral portfolio: portfolio delta ≈ 0")
-    print("• Rebalance frequency depends on gamma (delta sensitivity)")
-    print()
+    lines.append("1. DELTA RISK (Directional Risk)")
+    lines.append("-" * 35)
+    lines.append("• Delta measures directional exposure to underlying price")
+    lines.append("• Portfolio delta = sum of individual position deltas")
+    lines.append("• Delta-neutral portfolio: portfolio delta ≈ 0")
+    lines.append("• Rebalance frequency depends on gamma (delta sensitivity)")
+    lines.append("")
     
-    print("2. GAMMA RISK (Convexity Risk)")
-    print("-" * 35)
-    print("• Gamma measures how fast delta changes")
-    print("• High gamma = frequent rebalancing needed")
-    print("• Gamma risk highest for ATM options near expiration")
-    print("• Long options: positive gamma (beneficial)")
-    print("• Short options: negative gamma (risk)")
-    print()
+    lines.append("2. GAMMA RISK (Convexity Risk)")
+    lines.append("-" * 35)
+    lines.append("• Gamma measures how fast delta changes")
+    lines.append("• High gamma = frequent rebalancing needed")
+    lines.append("• Gamma risk highest for ATM options near expiration")
+    lines.append("• Long options: positive gamma (beneficial)")
+    lines.append("• Short options: negative gamma (risk)")
+    lines.append("")
     
-    print("3. THETA RISK (Time Decay Risk)")
-    print("-" * 35)
-    print("• Theta measures daily time decay")
-    print("• Long options: negative theta (lose value daily)")
-    print("• Short options: positive theta (gain value daily)")
-    print("• Theta accelerates as expiration approaches")
-    print("• ATM options have highest theta risk")
-    print()
+    lines.append("3. THETA RISK (Time Decay Risk)")
+    lines.append("-" * 35)
+    lines.append("• Theta measures daily time decay")
+    lines.append("• Long options: negative theta (lose value daily)")
+    lines.append("• Short options: positive theta (gain value daily)")
+    lines.append("• Theta accelerates as expiration approaches")
+    lines.append("• ATM options have highest theta risk")
+    lines.append("")
     
-    print("4. VEGA RISK (Volatility Risk)")
-    print("-" * 35)
-    print("• Vega measures sensitivity to volatility changes")
-    print("• Long options: positive vega (benefit from vol increase)")
-    print("• Short options: negative vega (hurt by vol increase)")
-    print("• Vega highest for ATM options with more time")
-    print("• Implied volatility can be as important as direction")
-    print()
+    lines.append("4. VEGA RISK (Volatility Risk)")
+    lines.append("-" * 35)
+    lines.append("• Vega measures sensitivity to volatility changes")
+    lines.append("• Long options: positive vega (benefit from vol increase)")
+    lines.append("• Short options: negative vega (hurt by vol increase)")
+    lines.append("• Vega highest for ATM options with more time")
+    lines.append("• Implied volatility can be as important as direction")
+    lines.append("")
     
-    print("5. RHO RISK (Interest Rate Risk)")
-    print("-" * 35)
-    print("• Rho measures sensitivity to interest rate changes")
-    print("• Generally smallest Greek for short-term options")
-    print("• More important for long-term options (LEAPS)")
-    print("• Call rho positive, put rho negative")
-    print()
+    lines.append("5. RHO RISK (Interest Rate Risk)")
+    lines.append("-" * 35)
+    lines.append("• Rho measures sensitivity to interest rate changes")
+    lines.append("• Generally smallest Greek for short-term options")
+    lines.append("• More important for long-term options (LEAPS)")
+    lines.append("• Call rho positive, put rho negative")
+    lines.append("")
+    
+    report = "\n".join(lines)
+    print(report)
+    return report
 
-def main():
+def main(exact=False):
     """Run all analyses"""
-    practical_hedging_example()
-    time_decay_analysis()
-    volatility_impact_analysis()
-    moneyness_analysis()
+    practical_hedging_example(exact=exact)
+    time_decay_analysis(exact=exact)
+    volatility_impact_analysis(exact=exact)
+    moneyness_analysis(exact=exact)
     risk_management_insights()
     
     print("=" * 60)
@@ -231,4 +365,10 @@ def main():
     print("see the Option_Greeks.ipynb notebook.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--exact", action="store_true",
+                        help="reprice every scenario with Black-Scholes and the exact normal CDF "
+                             "instead of approximations")
+    main(exact=parser.parse_args().exact)
\ No newline at end of file